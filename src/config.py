@@ -1,15 +1,67 @@
+import json
+import os
+import stat
 import sys
-from typing import Dict, Any
-
-import yaml
+from typing import Dict, Any, Optional
 
 from src.logger import logger
 
+def _source_signature(config_path: str) -> Dict[str, int]:
+    """캐시 유효성 확인용 YAML 파일 정보 (mtime, 크기)"""
+    st = os.stat(config_path)
+    return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+def _load_cached_config(config_path: str, cache_path: str) -> Optional[Dict[str, Any]]:
+    """YAML 파일과 mtime, 크기가 일치하는 JSON 캐시가 있으면 로드"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('source') != _source_signature(config_path):
+            return None
+        return cache.get('config')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _write_config_cache(config: Dict[str, Any], config_path: str, cache_path: str):
+    """파싱된 설정을 JSON 캐시로 저장 (실패 시 무시)"""
+    try:
+        data = json.dumps(
+            {'source': _source_signature(config_path), 'config': config},
+            ensure_ascii=False
+        )
+    except (TypeError, ValueError, OSError):
+        # JSON으로 표현할 수 없는 값(날짜 등)이 있으면 캐시하지 않음
+        return
+    
+    # 문자열이 아닌 키 등 JSON 변환 시 값이 바뀌는 경우에도 캐시하지 않음
+    if json.loads(data)['config'] != config:
+        return
+    
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        # 쿠키가 포함되므로 원본 YAML과 같은 권한으로 생성
+        mode = stat.S_IMODE(os.stat(config_path).st_mode)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"설정 캐시 저장 실패: {e}")
+
 def load_config(config_path: str = 'config.yaml') -> Dict[str, Any]:
     """설정 파일 로드"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        cache_path = f"{config_path}.cache.json"
+        config = _load_cached_config(config_path, cache_path)
+        
+        if config is None:
+            # 캐시가 없을 때만 yaml 모듈 로드
+            import yaml
+            # libyaml이 설치되어 있으면 C 구현 로더 사용
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=loader)
+            _write_config_cache(config, config_path, cache_path)
         
         # 필수 항목 검증
         required_keys = ['cookies', 'channels', 'output', 'monitoring']
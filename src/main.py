@@ -1,24 +1,24 @@
 import asyncio
+import logging
 import sys
 
-import colorlog
-
 from src.config import load_config
 from src.logger import logger
 from src.recorder import ChzzkRecorder
 
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
 async def main():
     config = load_config()
     
     log_level = config.get('logging', {}).get('level', 'INFO').upper() or 'INFO'
-    level_map = {
-        'DEBUG': colorlog.DEBUG,
-        'INFO': colorlog.INFO,
-        'WARNING': colorlog.WARNING,
-        'ERROR': colorlog.ERROR,
-        'CRITICAL': colorlog.CRITICAL,
-    }
-    logger.setLevel(level_map.get(log_level, colorlog.INFO))
+    logger.setLevel(_LEVEL_MAP.get(log_level, logging.INFO))
     
     recorder = ChzzkRecorder(config)
     await recorder.start()
@@ -1,12 +1,27 @@
 import asyncio
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-
-import aiohttp
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 from src.logger import logger
-from src.utils import sanitize_filename, cleanup_lockfiles
+from src.utils import sanitize_filename, find_lockfiles
+
+if TYPE_CHECKING:
+    import aiohttp
+
+def _parse_open_date(value: str) -> Optional[datetime]:
+    """'%Y-%m-%d %H:%M:%S' 형식의 openDate 파싱 (실패 시 None)"""
+    # fromisoformat은 'T' 구분자 등 다른 형식도 허용하므로 구분자 위치를 먼저 확인
+    if len(value) != 19 or not (
+        value[4] == value[7] == '-' and value[10] == ' ' and value[13] == value[16] == ':'
+    ):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 class ChzzkRecorder:
     def __init__(self, config: Dict[str, Any]):
@@ -15,33 +30,60 @@ class ChzzkRecorder:
         self.channels = config['channels']
         self.output_config = config['output']
         self.monitoring_config = config['monitoring']
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional['aiohttp.ClientSession'] = None
         self.channel_names: Dict[str, str] = {}  # channel_id -> channel_name 매핑
+        self._log_prefix: Dict[str, str] = {}  # channel_id -> "[channel_name]" 로그 접두사
+        self._miss_count: Dict[str, int] = {}  # channel_id -> 연속 오프라인 체크 횟수
+        self._post_tasks: set[asyncio.Task] = set()  # 진행 중인 후처리 태스크
+        self._post_locks: set[Path] = set()  # 후처리 태스크가 보유한 lock 파일
+        # 경로/파일명 템플릿은 설정값이므로 format 메서드를 미리 바인딩
+        self._render_path = self.output_config['path'].format
+        self._render_filename = self.output_config['filename'].format
         
     async def start(self):
+        # 세션이 필요한 시점에만 aiohttp 로드
+        import aiohttp
+        
         logger.info("치지직 자동 녹화를 시작합니다.")
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.session = aiohttp.ClientSession(headers=headers)
+        # 같은 호스트를 주기적으로 polling하므로 연결을 재사용
+        connector = aiohttp.TCPConnector(
+            limit=max(32, 4 * len(self.channels)),
+            limit_per_host=max(8, len(self.channels)),
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        self.session = aiohttp.ClientSession(
+            headers=headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15, connect=5)
+        )
         
         try:
             # 기존 lockfile 정리
-            self._cleanup_old_lockfiles()
+            await self._cleanup_old_lockfiles()
             
             # 채널 검증
             await self.validate_channels()
             
             # 각 채널마다 독립적인 모니터링 태스크 생성
-            tasks = [
-                asyncio.create_task(self.monitor_channel(channel_id))
-                for channel_id in self.channels
-            ]
-            await asyncio.gather(*tasks)
+            # 한 태스크가 실패하면 나머지 태스크도 함께 취소
+            async with asyncio.TaskGroup() as tg:
+                for channel_id in self.channels:
+                    tg.create_task(self.monitor_channel(channel_id))
+        except ExceptionGroup as eg:
+            for e in eg.exceptions:
+                logger.critical(f"오류가 발생하여 프로그램을 종료합니다: {e}")
         except Exception as e:
             logger.critical(f"오류가 발생하여 프로그램을 종료합니다: {e}")
         finally:
+            # 진행 중인 후처리가 끝날 때까지 대기
+            if self._post_tasks:
+                logger.info(f"진행 중인 후처리 {len(self._post_tasks)}개가 끝날 때까지 대기합니다...")
+                await asyncio.gather(*self._post_tasks, return_exceptions=True)
             await self.session.close()
     
     async def validate_channels(self):
@@ -53,22 +95,17 @@ class ChzzkRecorder:
             logger.error("HTTP 세션이 초기화되지 않았습니다")
             return
         
-        for channel_id in self.channels:
-            url = f"https://api.chzzk.naver.com/service/v1/channels/{channel_id}"
-            try:
-                async with self.session.get(url) as response:
-                    if response.status == 404:
-                        invalid_channels.append(channel_id)
-                    elif response.status != 200:
-                        logger.warning(f"[{channel_id}] API 응답 오류 (HTTP {response.status})")
-                    else:
-                        data = await response.json()
-                        channel_name = data.get('content', {}).get('channelName', channel_id)
-                        self.channel_names[channel_id] = channel_name
-                        logger.debug(f"{channel_name} ({channel_id}) 검증 성공")
-            except Exception as e:
-                logger.error(f"[{channel_id}] 검증 실패: {e}")
+        semaphore = asyncio.Semaphore(16)
+        results = await asyncio.gather(
+            *[self._validate_one(channel_id, semaphore) for channel_id in self.channels]
+        )
+        
+        for channel_id, channel_name in results:
+            if channel_name is None:
                 invalid_channels.append(channel_id)
+            else:
+                self.channel_names[channel_id] = channel_name
+                self._log_prefix[channel_id] = f"[{channel_name}]"
         
         if invalid_channels:
             logger.error(f"잘못된 채널 ID: {', '.join(invalid_channels)}")
@@ -78,37 +115,82 @@ class ChzzkRecorder:
         logger.info(f"모니터링 채널 ({len(self.channels)}개): [{channel_names_list}]")
         logger.debug("모든 채널 검증 완료")
     
-    def _cleanup_old_lockfiles(self):
+    async def _validate_one(self, channel_id: str, semaphore: asyncio.Semaphore) -> tuple[str, Optional[str]]:
+        """단일 채널 검증 (잘못된 채널이면 이름 대신 None 반환)"""
+        url = f"https://api.chzzk.naver.com/service/v1/channels/{channel_id}"
+        async with semaphore:
+            try:
+                async with self.session.get(url) as response:
+                    if response.status == 404:
+                        return channel_id, None
+                    if response.status != 200:
+                        logger.warning(f"[{channel_id}] API 응답 오류 (HTTP {response.status})")
+                        return channel_id, channel_id
+                    
+                    data = await response.json()
+                    channel_name = data.get('content', {}).get('channelName', channel_id)
+                    logger.debug(f"{channel_name} ({channel_id}) 검증 성공")
+                    return channel_id, channel_name
+            except Exception as e:
+                logger.error(f"[{channel_id}] 검증 실패: {e}")
+                return channel_id, None
+    
+    async def _cleanup_old_lockfiles(self):
         """시작 시 기존 lockfile 정리"""
         base_path = self.output_config['path'].split('{')[0].rstrip('/')
-        count = cleanup_lockfiles(base_path)
+        # 디렉토리 탐색과 삭제는 이벤트 루프를 막지 않도록 스레드에서 실행
+        lock_files = await asyncio.to_thread(find_lockfiles, base_path)
+        semaphore = asyncio.Semaphore(32)
+        
+        async def unlink(path: str) -> bool:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(os.unlink, path)
+                    return True
+                except OSError:
+                    return False
+        
+        results = await asyncio.gather(*[unlink(path) for path in lock_files])
+        count = sum(results)
         if count > 0:
             logger.info(f"기존 lockfile {count}개 정리")
     
     async def monitor_channel(self, channel_id: str):
         """채널 모니터링"""
-        channel_name = self.channel_names.get(channel_id, channel_id)
-        logger.info(f"[{channel_name}] 모니터링 시작")
+        prefix = self._log_prefix[channel_id]
+        logger.info("%s 모니터링 시작", prefix)
         
         while True:
             try:
                 # 방송 상태 확인
                 live_info = await self.check_live_status(channel_id)
-                channel_name = self.channel_names.get(channel_id, channel_id)
-                logger.debug(f"[{channel_name}] 방송 상태: {live_info}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s 방송 상태: %s", prefix, live_info)
                 
                 if live_info and live_info['status'] == 'OPEN':
                     # 방송 중이면 녹화 시작
+                    self._miss_count[channel_id] = 0
                     await self.start_recording(channel_id, live_info)
+                else:
+                    self._miss_count[channel_id] = self._miss_count.get(channel_id, 0) + 1
                 
                 # 다음 체크까지 대기
-                await asyncio.sleep(self.monitoring_config['check_interval'])
+                await asyncio.sleep(self._next_check_delay(channel_id))
                 
             except Exception as e:
-                channel_name = self.channel_names.get(channel_id, channel_id)
-                logger.error(f"[{channel_name}] 모니터링 오류: {e}")
+                logger.error("%s 모니터링 오류: %s", prefix, e)
                 await asyncio.sleep(self.monitoring_config['check_interval'])
     
+    def _next_check_delay(self, channel_id: str) -> float:
+        """오프라인이 계속될수록 체크 간격을 두 배씩 늘림 (max_check_interval까지)"""
+        base = self.monitoring_config['check_interval']
+        max_interval = max(base, self.monitoring_config.get('max_check_interval', 300))
+        miss = self._miss_count.get(channel_id, 0)
+        
+        # 지수가 무한히 커지지 않도록 제한 (2 ** 16배면 충분히 최대 간격을 넘음)
+        delay = base * 2 ** min(max(miss - 1, 0), 16)
+        return min(delay, max_interval)
+    
     async def check_live_status(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """방송 상태 확인"""
         url = f"https://api.chzzk.naver.com/service/v3/channels/{channel_id}/live-detail"
@@ -126,10 +208,9 @@ class ChzzkRecorder:
                     open_date_str = content.get('openDate')
                     open_date = None
                     if open_date_str:
-                        try:
-                            open_date = datetime.strptime(open_date_str, '%Y-%m-%d %H:%M:%S')
-                        except ValueError:
-                            logger.debug(f"[{channel_id}] openDate 파싱 실패: {open_date_str}")
+                        open_date = _parse_open_date(open_date_str)
+                        if open_date is None:
+                            logger.debug("[%s] openDate 파싱 실패: %s", channel_id, open_date_str)
                     
                     return {
                         'status': content.get('status'),
@@ -139,7 +220,7 @@ class ChzzkRecorder:
                         'openDate': open_date,
                     }
         except Exception as e:
-            logger.debug(f"[{channel_id}] API 요청 실패: {e}")
+            logger.debug("[%s] API 요청 실패: %s", channel_id, e)
         
         return None
     
@@ -155,24 +236,31 @@ class ChzzkRecorder:
             channel_name, title, open_date
         )
         
-        # 중복 녹화 방지
+        # 중복 녹화 방지 (lock 파일 생성과 존재 확인을 한 번에 처리)
         lock_file = output_path / f"{output_file}.lock"
-        if lock_file.exists():
-            logger.info(f"[{channel_name}] 녹화 건너뜀: 이미 녹화 중인 방송입니다.")
+        try:
+            lock_file.touch(exist_ok=False)
+        except FileExistsError:
+            if lock_file in self._post_locks:
+                logger.info(f"[{channel_name}] 녹화 건너뜀: 이전 녹화 파일의 후처리가 진행 중입니다.")
+            else:
+                logger.info(f"[{channel_name}] 녹화 건너뜀: 이미 녹화 중인 방송입니다.")
             return
         
+        # 후처리 태스크로 넘어가면 lock 파일은 후처리 완료 후 삭제
+        lock_released_by_post_task = False
         try:
-            # lock 파일 생성
-            lock_file.touch()
             logger.info(f"[{channel_name}] 방송 시작 감지: {title}")
             
             temp_file = output_path / f"temp_{output_file}"
             final_file = output_path / output_file
             
             # 기존 temp 파일이 있으면 삭제
-            if temp_file.exists():
-                logger.warning(f"[{channel_name}] 기존 temp 파일 삭제: {temp_file.name}")
+            try:
                 temp_file.unlink()
+                logger.warning(f"[{channel_name}] 기존 temp 파일 삭제: {temp_file.name}")
+            except FileNotFoundError:
+                pass
             
             # streamlink 명령어 구성
             streamlink_cmd = self._build_streamlink_command(
@@ -184,18 +272,27 @@ class ChzzkRecorder:
             process = await asyncio.create_subprocess_exec(
                 *streamlink_cmd,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=1 << 20
             )
             
             # stderr 로그 수집 및 출력 태스크
             stderr_lines = []
+            def handle_stderr_line(line: bytes):
+                line_str = line.decode('utf-8', errors='ignore').strip()
+                if line_str:
+                    stderr_lines.append(line_str)
+                    logger.debug("[%s] streamlink: %s", channel_name, line_str)
+            
             async def log_stderr():
                 if process.stderr:
-                    async for line in process.stderr:
-                        line_str = line.decode('utf-8', errors='ignore').strip()
-                        if line_str:
-                            stderr_lines.append(line_str)
-                            logger.debug(f"[{channel_name}] streamlink: {line_str}")
+                    # 줄 단위 대신 덩어리로 읽어 이벤트 루프 wakeup 횟수 감소
+                    pending = b''
+                    while chunk := await process.stderr.read(4096):
+                        *lines, pending = (pending + chunk).split(b'\n')
+                        for line in lines:
+                            handle_stderr_line(line)
+                    handle_stderr_line(pending)
             
             stderr_task = asyncio.create_task(log_stderr())
             
@@ -218,36 +315,50 @@ class ChzzkRecorder:
             
             logger.info(f"[{channel_name}] 녹화 완료")
             
-            # ffmpeg로 타임스탬프 재설정
+            # ffmpeg로 타임스탬프 재설정 (모니터링이 바로 재개되도록 백그라운드에서 실행)
             if temp_file.exists():
-                await self._fix_timestamps(temp_file, final_file, channel_name)
-                temp_file.unlink()  # 임시 파일 삭제
+                task = asyncio.create_task(
+                    self._fix_and_cleanup(temp_file, final_file, lock_file, channel_name)
+                )
+                self._post_tasks.add(task)
+                self._post_locks.add(lock_file)
+                task.add_done_callback(self._post_tasks.discard)
+                lock_released_by_post_task = True
             
         except Exception as e:
             logger.error(f"[{channel_name}] 녹화 오류: {e}")
         finally:
             # lock 파일 삭제
+            if not lock_released_by_post_task:
+                lock_file.unlink(missing_ok=True)
+    
+    async def _fix_and_cleanup(self, temp_file: Path, final_file: Path, lock_file: Path, channel_name: str):
+        """타임스탬프 재설정 후 임시 파일 및 lock 파일 정리"""
+        try:
+            await self._fix_timestamps(temp_file, final_file, channel_name)
+            temp_file.unlink(missing_ok=True)  # 임시 파일 삭제 (후처리 실패 시 이미 이동됨)
+        except Exception as e:
+            logger.error(f"[{channel_name}] 후처리 오류: {e}")
+        finally:
             lock_file.unlink(missing_ok=True)
+            self._post_locks.discard(lock_file)
     
     def _prepare_output_path(self, author: str, title: str, stream_start_time: datetime) -> tuple[Path, str]:
         """출력 경로 준비"""
+        # 경로와 파일명에 같은 값을 쓰므로 한 번만 변환
+        values = {
+            'author': sanitize_filename(author),
+            'title': sanitize_filename(title),
+            'time': stream_start_time,
+        }
+        
         # 경로 템플릿 처리 (author, title, time)
-        path_template = self.output_config['path']
-        path_str = path_template.format(
-            author=sanitize_filename(author),
-            title=sanitize_filename(title),
-            time=stream_start_time
-        )
+        path_str = self._render_path(**values)
         output_path = Path(path_str).expanduser()
         output_path.mkdir(parents=True, exist_ok=True)
         
         # 파일명 템플릿 처리 (author, title, time)
-        filename_template = self.output_config['filename']
-        filename = filename_template.format(
-            author=sanitize_filename(author),
-            title=sanitize_filename(title),
-            time=stream_start_time
-        )
+        filename = self._render_filename(**values)
         
         return output_path, filename
     
@@ -276,32 +387,34 @@ class ChzzkRecorder:
     ):
         """방송 종료 대기"""
         check_interval = self.monitoring_config['stop_check_interval']
+        # 프로세스 종료를 기다리는 동안 check_interval마다 방송 상태 확인
+        process_task = asyncio.create_task(process.wait())
         
-        # 첫 체크 전 대기
-        await asyncio.sleep(check_interval)
-        
-        while True:
-            # 프로세스가 이미 종료되었는지 확인
-            if process.returncode is not None:
-                logger.debug(f"[{channel_name}] streamlink 프로세스 종료 감지")
-                break
-            
-            # API로 방송 상태 확인
-            live_info = await self.check_live_status(channel_id)
-            
-            # 방송이 종료되었거나 다른 방송으로 변경됨
-            if not live_info or live_info['status'] != 'OPEN' or live_info['liveId'] != live_id:
-                logger.info(f"[{channel_name}] 방송 종료 감지")
-                try:
-                    process.terminate()
-                    await asyncio.sleep(5)
-                    if process.returncode is None:
-                        process.kill()
-                except Exception:
-                    pass
-                break
-            
-            await asyncio.sleep(check_interval)
+        try:
+            while True:
+                done, _ = await asyncio.wait({process_task}, timeout=check_interval)
+                if process_task in done:
+                    logger.debug(f"[{channel_name}] streamlink 프로세스 종료 감지")
+                    break
+                
+                # API로 방송 상태 확인
+                live_info = await self.check_live_status(channel_id)
+                
+                # 방송이 종료되었거나 다른 방송으로 변경됨
+                if not live_info or live_info['status'] != 'OPEN' or live_info['liveId'] != live_id:
+                    logger.info(f"[{channel_name}] 방송 종료 감지")
+                    try:
+                        process.terminate()
+                        try:
+                            await asyncio.wait_for(asyncio.shield(process_task), timeout=5)
+                        except TimeoutError:
+                            process.kill()
+                    except Exception:
+                        pass
+                    break
+        finally:
+            if not process_task.done():
+                process_task.cancel()
     
     async def _fix_timestamps(self, temp_file: Path, final_file: Path, channel_name: str):
         """타임스탬프 재설정"""
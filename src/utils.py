@@ -1,6 +1,7 @@
+import functools
 import os
-from pathlib import Path
 
+@functools.lru_cache(maxsize=32)
 def get_max_filename_length(path: str = '.') -> int:
     """파일시스템의 최대 파일명 길이 반환 (바이트)"""
     try:
@@ -30,31 +31,50 @@ def sanitize_filename(name: str, target_path: str = '.', reserve_bytes: int = 50
     if len(encoded) > max_bytes:
         # 바이트 단위로 자르되, 유효한 UTF-8 문자열 유지
         truncated = encoded[:max_bytes]
+        end = len(truncated)
+        # 마지막 문자의 시작 바이트 위치 찾기 (continuation byte: 10xxxxxx)
+        start = end
+        while start > 0 and (truncated[start - 1] & 0xC0) == 0x80:
+            start -= 1
+        
         # 마지막 불완전한 멀티바이트 문자 제거
-        while truncated:
-            try:
-                name = truncated.decode('utf-8')
-                # 말줄임표 추가
-                if len(name) > 3:
-                    name = name[:-3] + '...'
-                break
-            except UnicodeDecodeError:
-                truncated = truncated[:-1]
+        if start > 0:
+            lead = truncated[start - 1]
+            if lead < 0x80:
+                char_len = 1
+            elif (lead & 0xE0) == 0xC0:
+                char_len = 2
+            elif (lead & 0xF0) == 0xE0:
+                char_len = 3
+            else:
+                char_len = 4
+            if end - (start - 1) < char_len:
+                end = start - 1
+        
+        name = truncated[:end].decode('utf-8')
+        # 말줄임표 추가
+        if len(name) > 3:
+            name = name[:-3] + '...'
     
     return name
 
-def cleanup_lockfiles(base_path: str) -> int:
-    """기존 lockfile 정리"""
+def _iter_lockfiles(root: str):
+    """root 아래의 모든 .lock 파일 경로를 재귀적으로 반환"""
     try:
-        recordings_path = Path(base_path).expanduser()
-        
-        if not recordings_path.exists():
-            return 0
-        
-        lock_files = list(recordings_path.rglob('*.lock'))
-        for lock_file in lock_files:
-            lock_file.unlink(missing_ok=True)
-        
-        return len(lock_files)
-    except Exception:
-        return 0
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_lockfiles(entry.path)
+                elif entry.name.endswith('.lock'):
+                    yield entry.path
+    except OSError:
+        return
+
+def find_lockfiles(base_path: str) -> list[str]:
+    """기존 lockfile 목록 반환"""
+    recordings_path = os.path.expanduser(base_path) or '.'
+    
+    if not os.path.isdir(recordings_path):
+        return []
+    
+    return list(_iter_lockfiles(recordings_path))